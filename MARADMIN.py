@@ -14,33 +14,53 @@ Feeds / state
 - Detects new items since last run
 - Sends ONE Slack message (chunked if needed)
 - Persists seen IDs in a local JSON state file
+- Caches summaries by content hash so replays skip the OpenAI call
 
 Env:
   OPENAI_API_KEY=...
   SLACK_WEBHOOK_URL=...
   OPENAI_MODEL=gpt-4o-mini
   MARADMIN_FEED_URL=... (optional)
+  OPENAI_MAX_CONCURRENCY=5 (optional)
+  OPENAI_LATENCY_TARGET_S=60 (optional)
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
 import os
+import random
 import re
 import sys
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from html import unescape
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import feedparser
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import APIConnectionError, APITimeoutError, InternalServerError, OpenAI, RateLimitError
 
 
 DEFAULT_MODEL = "gpt-5-mini"
 DEFAULT_STATE_FILE = ".maradmin_state.json"
+DEFAULT_SUMMARY_CACHE_FILE = ".maradmin_summary_cache.json"
+SUMMARY_CACHE_MAX_AGE_DAYS = 30
+DEFAULT_HTML_CACHE_DIR = ".maradmin_html_cache"
+DEFAULT_HTML_CACHE_TTL_DAYS = 7.0
+
+# LRU capacity for seen IDs kept in state; the feed only ever returns ~10 items.
+MAX_SEEN_IDS = 1024
 
 DEFAULT_MARADMIN_FEED_URL = (
     "https://www.marines.mil/DesktopModules/ArticleCS/RSS.ashx"
@@ -48,6 +68,73 @@ DEFAULT_MARADMIN_FEED_URL = (
 )
 
 SLACK_MAX_CHARS = 35000  # buffer under Slack's max
+SLACK_POST_INTERVAL_S = 1.0  # webhooks allow ~1 message/sec
+SLACK_429_RETRIES = 3
+SLACK_MAX_RETRY_AFTER_S = 60.0  # cap on a single Retry-After wait
+
+# orjson is optional; it (de)serializes state several times faster than stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the C-backed lxml parser; fall back to the stdlib parser if it is not installed.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Page elements that never hold message text; dropped before get_text().
+NON_CONTENT_TAGS = ["script", "style", "noscript", "header", "footer", "nav"]
+# DNN content containers that hold the message body on Marines.mil pages.
+CONTENT_STRAINER = SoupStrainer("div", class_=re.compile(r"content|article|message", re.IGNORECASE))
+
+# A realistic desktop Chrome UA and headers (helps with basic WAF rules on Marines.mil).
+BROWSER_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache",
+    "Referer": "https://www.marines.mil/",
+    "DNT": "1",
+    "Upgrade-Insecure-Requests": "1",
+    # These are harmless if ignored; some WAFs look for them.
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "same-origin",
+    "Sec-Fetch-User": "?1",
+}
+
+# The feed is fetched over the same session, so override the HTML Accept header.
+FEED_ACCEPT = "application/rss+xml, application/xml;q=0.9, text/xml;q=0.8, */*;q=0.5"
+
+# Entries are fetched + summarized in parallel (network-bound work).
+DEFAULT_WORKERS = 8
+# Concurrent OpenAI requests (override via OPENAI_MAX_CONCURRENCY to fit the account's rate limits).
+# This is the ceiling; AIMDLimiter backs off below it on 429/5xx or slow responses.
+DEFAULT_OPENAI_CONCURRENCY = 5
+# Average latency above which the limiter treats OpenAI as congested. Sized for the default
+# reasoning model on a ~4000-token MARADMIN (override via OPENAI_LATENCY_TARGET_S), and
+# raised to OPENAI_LATENCY_BASELINE_MULTIPLE x the fastest call seen, so a model's normal
+# generation time is never mistaken for congestion.
+DEFAULT_OPENAI_LATENCY_TARGET_S = 60.0
+OPENAI_LATENCY_BASELINE_MULTIPLE = 3.0
+# Pause new OpenAI calls until the window resets once remaining quota drops below this share.
+OPENAI_LOW_QUOTA_FRACTION = 0.1
+# Transient OpenAI failures retried with exponential backoff + jitter.
+OPENAI_RETRY_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+OPENAI_MAX_TRIES = 6
+# Longest server-requested pause (Retry-After or x-ratelimit-reset-*) waited out in-run.
+# Longer ones (e.g. daily limits) defer the entry to the next run instead of hanging cron.
+OPENAI_MAX_PAUSE_S = 60.0
+# Concurrent Marines.mil page fetches, independent of --workers (be polite to the WAF).
+MAX_PAGE_FETCHES = 5
 
 
 # ----------------------------
@@ -56,8 +143,33 @@ SLACK_MAX_CHARS = 35000  # buffer under Slack's max
 
 SUMMARY_BULLETS = 5
 
+# LLM input budget for MARADMIN text: tokens when tiktoken is installed, else characters.
+# Trimming keeps the head (header, applicability) and a tail slice (POCs, restated deadlines).
+MAX_LLM_INPUT_TOKENS = 4000
+MAX_LLM_INPUT_CHARS = 12000
+LLM_INPUT_HEAD_FRACTION = 0.8
+
 # Regex helpers
 MARADMIN_NUM_RE = re.compile(r"\bMARADMIN\s+(\d{1,4}/\d{2})\b", re.IGNORECASE)
+# OpenAI x-ratelimit-reset-* durations, e.g. "1s", "6m0s", "20ms".
+DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+# First marker of the message body on a "Messages Display" page.
+MESSAGE_START_RE = re.compile(
+    r"\bMARADMINS?\s*:\s*\d+/\d+\b|\bMARADMIN\s+\d+/\d+\b|\bMSGID/GENADMIN\b",
+    re.IGNORECASE,
+)
+# Runs of blank lines collapsed when flattening HTML to text.
+MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+# An HTML tag (a bare '<' in text such as "TIS < 4 YRS" is not one), and
+# markup the tag-split fast path cannot flatten correctly.
+TAG_RE = re.compile(r"</?[A-Za-z][^<>]*>")
+RICH_MARKUP_RE = re.compile(r"<(?:script|style|!--|!\[CDATA\[)", re.IGNORECASE)
+# Leading bullet markers ('-', '\u2022', '*') on LLM output lines.
+BULLET_PREFIX_RE = re.compile(r"^[\-\u2022\*]+\s*")
+# An RSS summary counts as the full message only with both markers and enough text.
+MSGID_RE = re.compile(r"\bMSGID/", re.IGNORECASE)
+MARADMIN_WORD_RE = re.compile(r"\bMARADMIN\b", re.IGNORECASE)
+MIN_FULL_MESSAGE_CHARS = 1500
 
 
 # ----------------------------
@@ -71,134 +183,245 @@ def utc_now_iso_z() -> str:
 def load_state(path: str) -> Dict[str, Any]:
     if os.path.exists(path):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(path, "rb") as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
         except Exception:
             return {}
     return {}
 
 
 def save_state(path: str, state: Dict[str, Any]) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2, ensure_ascii=False)
-
+    """Write state atomically: a crash mid-write must not truncate seen IDs and re-alert everything."""
+    if orjson is not None:
+        data = orjson.dumps(state, option=orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(state, separators=(",", ":"), ensure_ascii=False, sort_keys=True).encode("utf-8")
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def fetch_rss_entries(
+    feed_url: str,
+    etag: Optional[str] = None,
+    modified: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str]]:
+    """Fetch the feed with a conditional GET over the shared session.
+
+    Returns (entries, etag, modified). On HTTP 304 the feed is unchanged and
+    entries is empty; the validators passed in are returned as-is.
+    """
+    headers = {"Accept": FEED_ACCEPT}
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+    r = _SESSION.get(feed_url, headers=headers, timeout=25)
+    if r.status_code == 304:
+        return [], etag, modified
+    r.raise_for_status()
 
-def fetch_rss_entries(feed_url: str) -> List[Dict[str, Any]]:
-    feed = feedparser.parse(feed_url)
+    feed = feedparser.parse(r.content)
     if getattr(feed, "bozo", False):
         raise RuntimeError(f"RSS parse error: {getattr(feed, 'bozo_exception', 'unknown')}")
 
     entries: List[Dict[str, Any]] = []
     for e in feed.entries:
         guid = e.get("id") or e.get("guid") or e.get("link") or e.get("title")
-        entries.append(
-            {
-                "guid": (guid or "").strip(),
-                "title": (e.get("title", "") or "").strip(),
-                "link": (e.get("link", "") or "").strip(),
-                "summary": ((e.get("summary", "") or e.get("description", "")) or "").strip(),
-                "published": ((e.get("published", "") or e.get("updated", "")) or "").strip(),
-            }
-        )
-    return entries
+        entry = {
+            "guid": (guid or "").strip(),
+            "title": (e.get("title", "") or "").strip(),
+            "link": (e.get("link", "") or "").strip(),
+            "summary": ((e.get("summary", "") or e.get("description", "")) or "").strip(),
+            "published": ((e.get("published", "") or e.get("updated", "")) or "").strip(),
+        }
+        entry["_nid"] = normalize_id(entry)  # computed once; reused for dedup, state and Slack
+        entries.append(entry)
+    return entries, r.headers.get("ETag"), r.headers.get("Last-Modified")
 
 
 def normalize_id(entry: Dict[str, Any]) -> str:
     return (entry.get("guid") or entry.get("link") or entry.get("title") or "").strip()
 
 
-def find_new_entries(entries: List[Dict[str, Any]], seen_ids: Set[str]) -> List[Dict[str, Any]]:
+def find_new_entries(entries: List[Dict[str, Any]], seen_ids: OrderedDict[str, None]) -> List[Dict[str, Any]]:
     new: List[Dict[str, Any]] = []
     for e in entries:
-        nid = normalize_id(e)
+        nid = e["_nid"]
         if nid and nid not in seen_ids:
             new.append(e)
     return new
 
 
-def http_get(url: str, timeout: int = 25) -> str:
-    """Fetch a Marines.mil page.
+def remember_seen(seen_ids: OrderedDict[str, None], nid: str) -> None:
+    """Mark nid as most recently seen, evicting the oldest IDs past MAX_SEEN_IDS."""
+    seen_ids[nid] = None
+    seen_ids.move_to_end(nid)
+    while len(seen_ids) > MAX_SEEN_IDS:
+        seen_ids.popitem(last=False)
 
-    Marines.mil can return HTTP 403 to non-browser requests. To reduce that,
-    we send a more complete, browser-like header set and use a Session.
 
-    If the site still returns 403, the caller should fall back to using the
-    RSS entry's summary text (which often contains the full message body).
+def build_session() -> requests.Session:
+    """Shared HTTP session for Marines.mil fetches and Slack posts.
+
+    Marines.mil can return HTTP 403 to non-browser requests. To reduce that,
+    we send a more complete, browser-like header set. Reusing one pooled
+    session keeps the TLS connection alive across entries and Slack chunks.
     """
 
     session = requests.Session()
+    session.headers.update(BROWSER_HEADERS)
+
+    # Retry feed and page GETs on 429/5xx. Slack POSTs are left out: a retried
+    # POST after a 5xx may duplicate a chunk, so post_to_slack handles 429 itself.
+    # raise_on_status=False hands the final response back so callers report it.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry))
+    return session
+
+
+_SESSION = build_session()
+_PAGE_FETCH_SEM = threading.BoundedSemaphore(MAX_PAGE_FETCHES)
 
-    # A realistic desktop Chrome UA and headers (helps with basic WAF rules).
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Cache-Control": "no-cache",
-        "Pragma": "no-cache",
-        "Referer": "https://www.marines.mil/",
-        "DNT": "1",
-        "Upgrade-Insecure-Requests": "1",
-        # These are harmless if ignored; some WAFs look for them.
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "same-origin",
-        "Sec-Fetch-User": "?1",
-    }
-
-    r = session.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+
+def http_get(url: str, timeout: int = 25) -> str:
+    """Fetch a Marines.mil page.
+
+    If the site still returns 403, the caller should fall back to using the
+    RSS entry's summary text (which often contains the full message body).
+    """
+    with _PAGE_FETCH_SEM:
+        r = _SESSION.get(url, timeout=timeout, allow_redirects=True)
     r.raise_for_status()
     return r.text
 
 
 def looks_like_full_message(text: str) -> bool:
-    """Heuristic: RSS summaries sometimes contain the full MARADMIN/ALMAR text."""
-    t = (text or "").lower()
-    if not t:
+    """Heuristic: RSS summaries sometimes contain the full MARADMIN text (MSGID header and all)."""
+    if len(text or "") <= MIN_FULL_MESSAGE_CHARS:
         return False
-    return (
-        "maradmin" in t
-        or "msgid/genadmin" in t
-        or "r " in t  # e.g., leading "R 301230Z DEC 25" lines
-    )
+    return MSGID_RE.search(text) is not None and MARADMIN_WORD_RE.search(text) is not None
 
 
 def clean_rss_summary(summary_html: str) -> str:
     """RSS summaries are often HTML; convert to plain text and normalize."""
     if not summary_html:
         return ""
-    soup = BeautifulSoup(summary_html, "html.parser")
+    if not RICH_MARKUP_RE.search(summary_html):
+        # Fast path: summaries are pre-formatted text in <p>/<br>, so split on tags
+        # like get_text("\n", strip=True) would, without building a parse tree.
+        parts = (unescape(p).strip() for p in TAG_RE.split(summary_html))
+        text = MULTI_NEWLINE_RE.sub("\n\n", "\n".join(p for p in parts if p)).strip()
+        if text:
+            return text
+    soup = BeautifulSoup(summary_html, HTML_PARSER)
     text = soup.get_text("\n", strip=True)
-    text = re.sub(r"\n{3,}", "\n\n", text).strip()
+    text = MULTI_NEWLINE_RE.sub("\n\n", text).strip()
     return text
 
 
-def extract_message_text(html: str) -> str:
-    """Extract readable MARADMIN text from Marines.mil "Messages Display" page."""
-    soup = BeautifulSoup(html, "html.parser")
+def html_to_text(html: str, parse_only: Optional[SoupStrainer] = None) -> str:
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+    for tag in soup(NON_CONTENT_TAGS):
+        tag.decompose()
     text = soup.get_text("\n")
-    text = re.sub(r"\n{3,}", "\n\n", text).strip()
-
-    markers = [
-        r"\bMARADMINS?\s*:\s*\d+/\d+\b",
-        r"\bMARADMIN\s+\d+/\d+\b",
-        r"\bMSGID/GENADMIN\b",
-    ]
-
-    start_idx = None
-    for pat in markers:
-        m = re.search(pat, text, flags=re.IGNORECASE)
-        if m:
-            start_idx = m.start()
-            break
+    return MULTI_NEWLINE_RE.sub("\n\n", text).strip()
+
 
-    if start_idx is None:
+def extract_message_text(html: str) -> str:
+    """Extract readable MARADMIN text from Marines.mil "Messages Display" page."""
+    # Parse only the content containers first; fall back to the whole page
+    # if the message marker is not inside them.
+    text = html_to_text(html, parse_only=CONTENT_STRAINER)
+    m = MESSAGE_START_RE.search(text)
+    if m is None:
+        text = html_to_text(html)
+        m = MESSAGE_START_RE.search(text)
+    if m is None:
         return text[:12000]
 
-    return text[start_idx : start_idx + 20000].strip()
+    return text[m.start() :].strip()
+
+
+def fetch_message_text(link: str, cache_dir: Optional[str] = None, ttl_days: float = 0, debug: bool = False) -> str:
+    """Fetch a MARADMIN page and extract its text, reusing text cached on disk by link."""
+    path = None
+    if cache_dir and ttl_days > 0:
+        path = os.path.join(cache_dir, hashlib.sha256(link.encode("utf-8")).hexdigest() + ".txt")
+        try:
+            if time.time() - os.path.getmtime(path) < ttl_days * 86400:
+                with open(path, "r", encoding="utf-8") as f:
+                    text = f.read()
+                if debug:
+                    print(f"[DEBUG] HTML cache hit, skipped page fetch: {link}", file=sys.stderr)
+                return text
+        except OSError:
+            pass
+
+    text = extract_message_text(http_get(link))
+
+    if path:
+        # Write via a temp file: a truncated .txt would be served as the full message until it expires.
+        tmp = f"{path}.tmp"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    return text
+
+
+def prune_html_cache(cache_dir: str, ttl_days: float) -> None:
+    """Delete cached page text past its TTL (and leftover temp files) so the cache stays bounded."""
+    if ttl_days <= 0 or not os.path.isdir(cache_dir):
+        return
+    cutoff = time.time() - ttl_days * 86400
+    for entry in os.scandir(cache_dir):
+        try:
+            if entry.name.endswith(".tmp") or entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+# ----------------------------
+# Summary cache
+# ----------------------------
+
+def summary_cache_key(model: str, instructions: str, user_input: str) -> str:
+    raw = f"{model}\x00{instructions}\x00{user_input}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def load_summary_cache(path: str, model: str) -> Dict[str, Any]:
+    """Load cached summaries; a model change starts a fresh cache and stale entries are evicted."""
+    cache = load_state(path)
+    if cache.get("model") != model or not isinstance(cache.get("entries"), dict):
+        return {"model": model, "entries": {}}
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=SUMMARY_CACHE_MAX_AGE_DAYS)
+    fresh: Dict[str, Any] = {}
+    for key, item in cache["entries"].items():
+        try:
+            created = datetime.fromisoformat(item["created_utc"].replace("Z", "+00:00"))
+        except Exception:
+            continue
+        if created >= cutoff:
+            fresh[key] = item
+    cache["entries"] = fresh
+    return cache
 
 
 # ----------------------------
@@ -206,7 +429,8 @@ def extract_message_text(html: str) -> str:
 # ----------------------------
 
 def extract_maradmin_number(title: str, body: str) -> Optional[str]:
-    m = MARADMIN_NUM_RE.search(f"{title}\n{body}")
+    # Search the (short) title before the body instead of copying both into one string.
+    m = MARADMIN_NUM_RE.search(title) or MARADMIN_NUM_RE.search(body)
     return m.group(1) if m else None
 
 
@@ -222,6 +446,7 @@ def format_prompt(template: str, **kwargs: Any) -> str:
         return template
 
 
+@functools.lru_cache(maxsize=4)
 def build_llm_instructions(bullets: int) -> str:
     base_default = (
         "You summarize USMC MARADMINS for a Marine cyberspace warfare officer.\n"
@@ -242,6 +467,205 @@ def build_llm_instructions(bullets: int) -> str:
     return format_prompt(env_or_default('MARADMIN_PROMPT_STANDARD', prompt_default), bullets=bullets)
 
 
+@functools.lru_cache(maxsize=1)
+def token_encoding() -> Any:
+    """tiktoken encoding for the gpt-4o/gpt-5 family, or None if tiktoken is unavailable."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def trim_for_llm(text: str) -> str:
+    """Trim long bodies to a head + tail window within the LLM input budget."""
+    enc = token_encoding()
+    if enc is None:
+        if len(text) <= MAX_LLM_INPUT_CHARS:
+            return text
+        head = int(MAX_LLM_INPUT_CHARS * LLM_INPUT_HEAD_FRACTION)
+        return text[:head] + "\n...\n" + text[-(MAX_LLM_INPUT_CHARS - head):]
+
+    # Page text is data, not a prompt: encode "<|endoftext|>" etc. as plain text.
+    toks = enc.encode(text, disallowed_special=())
+    if len(toks) <= MAX_LLM_INPUT_TOKENS:
+        return text
+    head = int(MAX_LLM_INPUT_TOKENS * LLM_INPUT_HEAD_FRACTION)
+    return enc.decode(toks[:head]) + "\n...\n" + enc.decode(toks[-(MAX_LLM_INPUT_TOKENS - head):])
+
+
+class OpenAIPausedError(RuntimeError):
+    """OpenAI asked us to hold off longer than OPENAI_MAX_PAUSE_S."""
+
+
+# Errors that leave an entry unseen so the next run summarizes it again.
+OPENAI_DEFER_ERRORS = OPENAI_RETRY_ERRORS + (OpenAIPausedError,)
+
+
+class AIMDLimiter:
+    """Adaptive cap on in-flight OpenAI calls (additive increase, multiplicative decrease).
+
+    Each fast success raises the limit by `alpha` up to `c_max`. A 429/5xx, or an
+    average latency across the last `window` calls over the larger of
+    `latency_target` and `baseline_multiple` x the fastest call seen, multiplies
+    it by `beta` (never below `c_min`).
+    """
+
+    def __init__(
+        self,
+        c_max: int,
+        c_min: int = 1,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        latency_target: float = DEFAULT_OPENAI_LATENCY_TARGET_S,
+        baseline_multiple: float = OPENAI_LATENCY_BASELINE_MULTIPLE,
+        window: int = 10,
+    ) -> None:
+        self.c_max = max(1, c_max)
+        self.c_min = max(1, min(c_min, self.c_max))
+        self.alpha = alpha
+        self.beta = beta
+        self.latency_target = latency_target
+        self.baseline_multiple = baseline_multiple
+        self.min_latency: Optional[float] = None
+        self.limit = float(self.c_max)
+        self.in_flight = 0
+        self.latencies: deque = deque(maxlen=window)
+        self.pause_until = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        """Wait for a slot; raise OpenAIPausedError if the quota pause outlasts OPENAI_MAX_PAUSE_S."""
+        with self._cond:
+            while True:
+                wait = self.pause_until - time.monotonic()
+                if wait > OPENAI_MAX_PAUSE_S:
+                    raise OpenAIPausedError(f"OpenAI quota paused for {wait:.0f}s")
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    break
+                self._cond.wait(timeout=wait if wait > 0 else None)
+            self.in_flight += 1
+
+    def note_rate_limits(self, headers: Mapping[str, str]) -> None:
+        """Hold new calls until the reset time when remaining requests/tokens run low."""
+        for kind in ("requests", "tokens"):
+            try:
+                remaining = int(headers.get(f"x-ratelimit-remaining-{kind}", ""))
+                limit = int(headers.get(f"x-ratelimit-limit-{kind}", ""))
+            except ValueError:
+                continue
+            low = OPENAI_LOW_QUOTA_FRACTION * limit
+            if kind == "requests":
+                low = max(2.0, low)
+            if remaining >= low:
+                continue
+            reset = parse_duration_seconds(headers.get(f"x-ratelimit-reset-{kind}", ""))
+            if reset > 0:
+                with self._cond:
+                    self.pause_until = max(self.pause_until, time.monotonic() + reset)
+
+    def release(self, latency: float, error: bool = False) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self.latencies.append(latency)
+            if not error and (self.min_latency is None or latency < self.min_latency):
+                self.min_latency = latency
+            target = self.latency_target
+            if self.min_latency is not None:
+                target = max(target, self.baseline_multiple * self.min_latency)
+            avg = sum(self.latencies) / len(self.latencies)
+            if error or avg > target:
+                self.limit = max(float(self.c_min), self.limit * self.beta)
+                self.latencies.clear()  # judge the new limit on fresh samples
+            else:
+                self.limit = min(float(self.c_max), self.limit + self.alpha)
+            self._cond.notify_all()
+
+
+def parse_duration_seconds(raw: str) -> float:
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum((float(n) * scale[unit] for n, unit in DURATION_PART_RE.findall(raw or "")), 0.0)
+
+
+def retry_after_seconds(ex: BaseException) -> Optional[float]:
+    """Server-requested delay from a failed call's Retry-After(-ms) header, if any."""
+    headers = getattr(getattr(ex, "response", None), "headers", None)
+    if not headers:
+        return None
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        try:
+            return max(0.0, float(headers[name]) * scale)
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+def backoff_retry(
+    max_tries: int = OPENAI_MAX_TRIES,
+    base: float = 1.0,
+    cap: float = 30.0,
+    retry_on: Tuple[type, ...] = OPENAI_RETRY_ERRORS,
+):
+    """Retry the wrapped call on `retry_on` errors with full-jitter exponential backoff.
+
+    A Retry-After header on the error is honored instead of the jittered delay; one
+    longer than OPENAI_MAX_PAUSE_S re-raises at once so the caller can defer the work.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            for attempt in range(max_tries):
+                try:
+                    return fn(*args, **kwargs)
+                except retry_on as ex:
+                    if attempt == max_tries - 1:
+                        raise
+                    delay = retry_after_seconds(ex)
+                    if delay is not None and delay > OPENAI_MAX_PAUSE_S:
+                        raise
+                    if delay is None:
+                        delay = random.uniform(0, min(cap, base * 2 ** attempt))
+                    time.sleep(delay)
+
+        return wrapper
+
+    return decorator
+
+
+@backoff_retry()
+def call_openai(
+    client: OpenAI,
+    model: str,
+    instructions: str,
+    user_input: str,
+    limiter: Optional[AIMDLimiter] = None,
+) -> str:
+    # The limiter is held per attempt, never across backoff sleeps.
+    if limiter is not None:
+        limiter.acquire()
+    t0 = time.monotonic()
+    throttled = False
+    try:
+        raw = client.responses.with_raw_response.create(
+            model=model,
+            instructions=instructions,
+            input=user_input,
+            temperature=0.2,
+        )
+    except (RateLimitError, InternalServerError):
+        throttled = True
+        raise
+    finally:
+        if limiter is not None:
+            limiter.release(time.monotonic() - t0, error=throttled)
+    if limiter is not None:
+        limiter.note_rate_limits(raw.headers)
+    resp = raw.parse()
+    return (resp.output_text or "").strip()
+
+
 def summarize_maradmin(
     client: OpenAI,
     model: str,
@@ -250,8 +674,13 @@ def summarize_maradmin(
     published: str,
     maradmin_text: str,
     bullets: int,
+    cache: Optional[Dict[str, Any]] = None,
+    limiter: Optional[AIMDLimiter] = None,
+    instructions: Optional[str] = None,
 ) -> List[str]:
-    instructions = build_llm_instructions(bullets=bullets)
+    maradmin_text = trim_for_llm(maradmin_text)
+    if instructions is None:
+        instructions = build_llm_instructions(bullets=bullets)
 
     user_input = (
         f"Title: {title}\n"
@@ -261,29 +690,25 @@ def summarize_maradmin(
         f"{maradmin_text}"
     )
 
-    resp = client.responses.create(
-        model=model,
-        instructions=instructions,
-        input=user_input,
-        temperature=0.2,
-    )
+    # Key on the full prompt: entries sharing page text (e.g. an interstitial)
+    # must not reuse each other's bullets.
+    key = summary_cache_key(model, instructions, user_input)
+    if cache is not None and key in cache:
+        return list(cache[key]["bullets"])
 
-    out = (resp.output_text or "").strip()
+    out = call_openai(client, model, instructions, user_input, limiter=limiter)
 
-    lines: List[str] = []
-    for line in out.splitlines():
-        s = line.strip()
-        if not s:
-            continue
-        s = re.sub(r"^[\-\u2022\*]+\s*", "", s)  # strip leading '-', '-', '*'
-        if s:
-            lines.append(s)
+    stripped = (BULLET_PREFIX_RE.sub("", s) for s in map(str.strip, out.splitlines()) if s)
+    lines = [s for s in stripped if s]
 
     if not lines:
         lines = ["No extractable summary produced from the available text."]
 
     # Soft cap: do not exceed the requested max
-    return lines[: max(1, bullets)]
+    lines = lines[: max(1, bullets)]
+    if cache is not None:
+        cache[key] = {"bullets": lines, "created_utc": utc_now_iso_z()}
+    return lines
 
 
 # ----------------------------
@@ -301,21 +726,13 @@ def build_slack_message(new_entries: List[Dict[str, Any]], summaries: Dict[str,
 
     parts: List[str] = [header]
     for e in new_entries:
-        title = e.get("title", "MARADMIN")
-        link = e.get("link", "")
-        published = e.get("published", "")
-        nid = normalize_id(e)
+        title, link, published, nid = e["title"], e["link"], e["published"], e["_nid"]
 
         info = summaries.get(nid, {})
-        maradmin_number = info.get("maradmin_number")
+        label = entry_label(maradmin_number=info.get("maradmin_number"))
 
-        label = entry_label(maradmin_number=maradmin_number)
         parts.append(f"*<{link}|{title}>*  _(Published: {published})_\n_{label}_")
-
-        bullets = info.get("bullets", [])
-        for b in bullets:
-            parts.append(f"- {b}")
-
+        parts.extend(f"- {b}" for b in info.get("bullets", []))
         parts.append("")  # spacer line
 
     return "\n".join(parts).strip()
@@ -327,23 +744,181 @@ def chunk_for_slack(msg: str, max_chars: int = SLACK_MAX_CHARS) -> List[str]:
 
     lines = msg.splitlines(True)  # keep newlines
     chunks: List[str] = []
-    buf = ""
+    cur: List[str] = []
+    cur_len = 0
     for line in lines:
-        if len(buf) + len(line) > max_chars and buf:
-            chunks.append(buf)
-            buf = ""
-        buf += line
-    if buf:
-        chunks.append(buf)
+        if cur_len + len(line) > max_chars and cur:
+            chunks.append("".join(cur))
+            cur = []
+            cur_len = 0
+        cur.append(line)
+        cur_len += len(line)
+    if cur:
+        chunks.append("".join(cur))
     return chunks
 
 
 def post_to_slack(webhook_url: str, text: str) -> None:
-    r = requests.post(webhook_url, json={"text": text}, timeout=20)
+    # A 429 means Slack rejected the message, so resending it cannot duplicate.
+    for attempt in range(SLACK_429_RETRIES + 1):
+        r = _SESSION.post(webhook_url, json={"text": text}, timeout=20)
+        if r.status_code != 429 or attempt == SLACK_429_RETRIES:
+            break
+        try:
+            wait = float(r.headers.get("Retry-After", 1))
+        except ValueError:
+            wait = 1.0
+        time.sleep(min(max(wait, 0.0), SLACK_MAX_RETRY_AFTER_S))
     if r.status_code >= 300:
         raise RuntimeError(f"Slack webhook error {r.status_code}: {r.text[:400]}")
 
 
+# ----------------------------
+# Entry processing
+# ----------------------------
+
+def process_entry(
+    e: Dict[str, Any],
+    client: Optional[OpenAI],
+    model: str,
+    show_raw: bool,
+    cache: Optional[Dict[str, Any]] = None,
+    html_cache_dir: Optional[str] = None,
+    html_cache_ttl_days: float = 0,
+    limiter: Optional[AIMDLimiter] = None,
+    instructions: Optional[str] = None,
+    debug: bool = False,
+) -> Dict[str, Any]:
+    """Fetch and summarize one RSS entry. Never raises; failures become a link-only summary.
+
+    If OpenAI is still failing after retries, the result carries retry_next_run=True
+    so main() leaves the entry unseen and the next run summarizes it again.
+    """
+    title = e.get("title", "MARADMIN")
+    link = e.get("link", "")
+    published = e.get("published", "")
+    rss_summary = e.get("summary", "")
+    rss_text = ""
+
+    try:
+        # Prefer RSS summary if it already contains the full message text.
+        rss_text = clean_rss_summary(rss_summary)
+        maradmin_text = ""
+        if looks_like_full_message(rss_text):
+            maradmin_text = rss_text
+            if debug:
+                print(f"[DEBUG] Using RSS text ({len(rss_text)} chars), skipped page fetch: {link}", file=sys.stderr)
+
+        # If RSS summary isn't sufficient, fetch the article page.
+        if not maradmin_text:
+            maradmin_text = fetch_message_text(
+                link,
+                cache_dir=html_cache_dir,
+                ttl_days=html_cache_ttl_days,
+                debug=debug,
+            )
+
+        maradmin_number = extract_maradmin_number(title, maradmin_text)
+
+        bullets = SUMMARY_BULLETS
+
+        if show_raw:
+            # Single print so output from parallel workers does not interleave.
+            print(
+                f"\n--- {title} ---\n"
+                f"Link: {link}\n"
+                f"MARADMIN: {maradmin_number or 'Not stated'}\n"
+                f"{maradmin_text[:4000]}"
+            )
+            return {
+                "maradmin_number": maradmin_number,
+                "bullets": ["(show-raw enabled; not summarized)", "Open the link to read."],
+            }
+
+        bullet_lines = summarize_maradmin(
+            client=client,  # type: ignore[arg-type]
+            model=model,
+            title=title,
+            link=link,
+            published=published,
+            maradmin_text=maradmin_text,
+            bullets=bullets,
+            cache=cache,
+            limiter=limiter,
+            instructions=instructions,
+        )
+        return {
+            "maradmin_number": maradmin_number,
+            "bullets": bullet_lines,
+        }
+
+    except requests.HTTPError as ex:
+        # Common case: Marines.mil returns 403 to non-browser clients.
+        # Fall back to the RSS summary if available; otherwise keep it clean.
+        fallback = rss_text
+        if not fallback:
+            return {
+                "maradmin_number": None,
+                "bullets": ["Open the link to read this MARADMIN."],
+            }
+        try:
+            maradmin_text = fallback
+            maradmin_number = extract_maradmin_number(title, maradmin_text)
+            bullets = SUMMARY_BULLETS
+
+            if show_raw:
+                return {
+                    "maradmin_number": maradmin_number,
+                    "bullets": ["(show-raw enabled; using RSS summary)", "Open the link to read."],
+                }
+
+            bullet_lines = summarize_maradmin(
+                client=client,  # type: ignore[arg-type]
+                model=model,
+                title=title,
+                link=link,
+                published=published,
+                maradmin_text=maradmin_text,
+                bullets=bullets,
+                cache=cache,
+                limiter=limiter,
+                instructions=instructions,
+            )
+            # If we had to fall back, add a quiet note only when useful.
+            if ex.response is not None and ex.response.status_code == 403:
+                bullet_lines = bullet_lines[:]
+                bullet_lines.append("(Note: full text fetch blocked; using RSS excerpt - open link for full details.)")
+            return {
+                "maradmin_number": maradmin_number,
+                "bullets": bullet_lines,
+            }
+        except OPENAI_DEFER_ERRORS:
+            return {
+                "maradmin_number": None,
+                "bullets": ["Open the link to read this MARADMIN."],
+                "retry_next_run": True,
+            }
+        except Exception:
+            return {
+                "maradmin_number": None,
+                "bullets": ["Open the link to read this MARADMIN."],
+            }
+
+    except OPENAI_DEFER_ERRORS:
+        return {
+            "maradmin_number": None,
+            "bullets": ["Open the link to read this MARADMIN."],
+            "retry_next_run": True,
+        }
+
+    except Exception:
+        # Keep Slack clean - no stack traces or noisy errors.
+        return {
+            "maradmin_number": None,
+            "bullets": ["Open the link to read this MARADMIN."],
+        }
+
+
 # ----------------------------
 # CLI + main
 # ----------------------------
@@ -353,10 +928,35 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--feed-url", default=os.getenv("MARADMIN_FEED_URL", DEFAULT_MARADMIN_FEED_URL))
     p.add_argument("--model", default=os.getenv("OPENAI_MODEL", DEFAULT_MODEL))
     p.add_argument("--state-file", default=DEFAULT_STATE_FILE)
+    p.add_argument(
+        "--summary-cache",
+        default=None,
+        help=f"Path to summary cache JSON (default: {DEFAULT_SUMMARY_CACHE_FILE} next to the state file)",
+    )
+    p.add_argument(
+        "--html-cache-ttl",
+        type=float,
+        default=DEFAULT_HTML_CACHE_TTL_DAYS,
+        help="Days to reuse extracted page text cached next to the state file (0 disables)",
+    )
     p.add_argument("--max", type=int, default=10, help="Max RSS entries to process per run")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Entries fetched/summarized in parallel")
+    p.add_argument(
+        "--openai-concurrency",
+        type=int,
+        default=os.getenv("OPENAI_MAX_CONCURRENCY", str(DEFAULT_OPENAI_CONCURRENCY)),
+        help="Max OpenAI requests in flight (adaptive ceiling)",
+    )
+    p.add_argument(
+        "--openai-latency-target",
+        type=float,
+        default=os.getenv("OPENAI_LATENCY_TARGET_S", str(DEFAULT_OPENAI_LATENCY_TARGET_S)),
+        help="Average OpenAI latency (seconds) above which concurrency backs off",
+    )
     p.add_argument("--dry-run", action="store_true", help="Do not post to Slack; print output")
     p.add_argument("--force", action="store_true", help="Treat all fetched entries as new")
     p.add_argument("--show-raw", action="store_true", help="Print parsed MARADMIN text for new items")
+    p.add_argument("--debug", action="store_true", help="Print fetch/cache decisions to stderr")
     return p.parse_args()
 
 
@@ -367,6 +967,8 @@ def main() -> int:
     feed_url = args.feed_url
     model = args.model
     state_path = args.state_file
+    cache_path = args.summary_cache or os.path.join(os.path.dirname(state_path), DEFAULT_SUMMARY_CACHE_FILE)
+    html_cache_dir = os.path.join(os.path.dirname(state_path), DEFAULT_HTML_CACHE_DIR)
 
     openai_key = os.getenv("OPENAI_API_KEY", "").strip()
     slack_webhook = os.getenv("SLACK_WEBHOOK_URL", "").strip()
@@ -378,6 +980,8 @@ def main() -> int:
         print("ERROR: SLACK_WEBHOOK_URL is not set (or use --dry-run).", file=sys.stderr)
         return 2
 
+    prune_html_cache(html_cache_dir, args.html_cache_ttl)
+
     state = load_state(state_path)
     # Backward compatible: accept different keys if you ever changed them
     seen_list = (
@@ -387,121 +991,71 @@ def main() -> int:
         or state.get("seen")
         or []
     )
-    seen_ids: Set[str] = set(seen_list if isinstance(seen_list, list) else [])
-
-    entries = fetch_rss_entries(feed_url)[: max(1, args.max)]
+    # LRU order (oldest first); persisted as a plain list in the same order.
+    seen_ids: OrderedDict[str, None] = OrderedDict.fromkeys(seen_list if isinstance(seen_list, list) else [])
+
+    # Validators only apply to the feed they came from; --force skips the
+    # conditional GET so every entry is re-fetched.
+    conditional = not args.force and state.get("rss_feed_url") == feed_url
+    entries, etag, modified = fetch_rss_entries(
+        feed_url,
+        etag=state.get("rss_etag") if conditional else None,
+        modified=state.get("rss_modified") if conditional else None,
+    )
+    state["rss_feed_url"] = feed_url
+    state["rss_etag"] = etag
+    state["rss_modified"] = modified
+    entries = entries[: max(1, args.max)]
     new_entries = entries if args.force else find_new_entries(entries, seen_ids)
+    # IDs still in the feed are refreshed so LRU eviction never drops them.
+    for e in entries:
+        nid = e["_nid"]
+        if nid in seen_ids:
+            remember_seen(seen_ids, nid)
 
     if not new_entries:
         # Update last_run and exit
         state["last_run_utc"] = utc_now_iso_z()
-        state["seen_ids"] = sorted(seen_ids)
+        state["seen_ids"] = list(seen_ids)
         save_state(state_path, state)
         return 0
 
-    client = OpenAI(api_key=openai_key) if openai_key else None
+    # SDK retries are off; call_openai's backoff is the single retry policy.
+    client = OpenAI(api_key=openai_key, max_retries=0) if openai_key else None
+    summary_cache = load_summary_cache(cache_path, model)
+    openai_limiter = AIMDLimiter(c_max=args.openai_concurrency, latency_target=args.openai_latency_target)
+    instructions = build_llm_instructions(bullets=SUMMARY_BULLETS)
 
     summaries: Dict[str, Dict[str, Any]] = {}
-    for e in new_entries:
-        nid = normalize_id(e)
-        title = e.get("title", "MARADMIN")
-        link = e.get("link", "")
-        published = e.get("published", "")
-        rss_summary = e.get("summary", "")
-
-        try:
-            # Prefer RSS summary if it already contains the full message text.
-            maradmin_text = ""
-            if looks_like_full_message(rss_summary):
-                maradmin_text = clean_rss_summary(rss_summary)
-
-            # If RSS summary isn't sufficient, fetch the article page.
-            if not maradmin_text:
-                html = http_get(link)
-                maradmin_text = extract_message_text(html)
-
-            maradmin_number = extract_maradmin_number(title, maradmin_text)
-
-            bullets = SUMMARY_BULLETS
-
-            if args.show_raw:
-                print(f"\n--- {title} ---")
-                print(f"Link: {link}")
-                print(f"MARADMIN: {maradmin_number or 'Not stated'}")
-                print(maradmin_text[:4000])
-                summaries[nid] = {
-                    "maradmin_number": maradmin_number,
-                    "bullets": ["(show-raw enabled; not summarized)", "Open the link to read."],
-                }
-            else:
-                bullet_lines = summarize_maradmin(
-                    client=client,  # type: ignore[arg-type]
-                    model=model,
-                    title=title,
-                    link=link,
-                    published=published,
-                    maradmin_text=maradmin_text,
-                    bullets=bullets,
-                )
-                summaries[nid] = {
-                    "maradmin_number": maradmin_number,
-                    "bullets": bullet_lines,
-                }
-
-            seen_ids.add(nid)
-
-        except requests.HTTPError as ex:
-            # Common case: Marines.mil returns 403 to non-browser clients.
-            # Fall back to the RSS summary if available; otherwise keep it clean.
-            fallback = clean_rss_summary(rss_summary)
-            if fallback:
-                try:
-                    maradmin_text = fallback
-                    maradmin_number = extract_maradmin_number(title, maradmin_text)
-                    bullets = SUMMARY_BULLETS
-
-                    if args.show_raw:
-                        summaries[nid] = {
-                            "maradmin_number": maradmin_number,
-                            "bullets": ["(show-raw enabled; using RSS summary)", "Open the link to read."],
-                        }
-                    else:
-                        bullet_lines = summarize_maradmin(
-                            client=client,  # type: ignore[arg-type]
-                            model=model,
-                            title=title,
-                            link=link,
-                            published=published,
-                            maradmin_text=maradmin_text,
-                            bullets=bullets,
-                        )
-                        # If we had to fall back, add a quiet note only when useful.
-                        if ex.response is not None and ex.response.status_code == 403:
-                            bullet_lines = bullet_lines[:]
-                            bullet_lines.append("(Note: full text fetch blocked; using RSS excerpt - open link for full details.)")
-                        summaries[nid] = {
-                            "maradmin_number": maradmin_number,
-                            "bullets": bullet_lines,
-                        }
-                except Exception:
-                    summaries[nid] = {
-                        "maradmin_number": None,
-                        "bullets": ["Open the link to read this MARADMIN."],
-                    }
-            else:
-                summaries[nid] = {
-                    "maradmin_number": None,
-                    "bullets": ["Open the link to read this MARADMIN."],
-                }
-            seen_ids.add(nid)
-
-        except Exception:
-            # Keep Slack clean - no stack traces or noisy errors.
-            summaries[nid] = {
-                "maradmin_number": None,
-                "bullets": ["Open the link to read this MARADMIN."],
-            }
-            seen_ids.add(nid)
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {
+            pool.submit(
+                process_entry,
+                e,
+                client=client,
+                model=model,
+                show_raw=args.show_raw,
+                cache=summary_cache["entries"],
+                html_cache_dir=html_cache_dir,
+                html_cache_ttl_days=args.html_cache_ttl,
+                limiter=openai_limiter,
+                instructions=instructions,
+                debug=args.debug,
+            ): e["_nid"]
+            for e in new_entries
+        }
+        for fut in as_completed(futures):
+            summaries[futures[fut]] = fut.result()
+    deferred = 0
+    for nid in futures.values():
+        if summaries[nid].get("retry_next_run"):
+            deferred += 1
+            continue
+        remember_seen(seen_ids, nid)
+    if deferred:
+        # Skip the conditional GET next run so deferred entries are fetched again.
+        state["rss_etag"] = None
+        state["rss_modified"] = None
 
     message = build_slack_message(new_entries, summaries)
     chunks = chunk_for_slack(message)
@@ -511,12 +1065,15 @@ def main() -> int:
             print(c)
             print("\n" + "=" * 80 + "\n")
     else:
-        for c in chunks:
+        for i, c in enumerate(chunks):
+            if i:
+                time.sleep(SLACK_POST_INTERVAL_S)
             post_to_slack(slack_webhook, c)
 
-    state["seen_ids"] = sorted(seen_ids)
+    state["seen_ids"] = list(seen_ids)
     state["last_run_utc"] = utc_now_iso_z()
     save_state(state_path, state)
+    save_state(cache_path, summary_cache)
     return 0
 
 
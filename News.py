@@ -25,34 +25,70 @@ Env (.env recommended):
 Deps:
   pip install openai feedparser python-dotenv requests
   (Optional on some Windows installs) pip install tzdata
+  (Optional, faster RSS parsing; titles can differ slightly) pip install feedparser-rs
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
 import os
 import re
 import sys
-from datetime import datetime, timezone
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone, tzinfo
 from email.utils import parsedate_to_datetime
-from typing import Any, Dict, List, Optional, Tuple
+from html import unescape
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import feedparser
 import requests
 from dotenv import load_dotenv
-from openai import OpenAI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# openai (pydantic/httpx) and feedparser are slow to import; they are loaded on first use
+# so a cron run that only sees unchanged feeds never pays for them.
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 # ----------------------------
 # Defaults / Config
 # ----------------------------
 DEFAULT_MODEL = "gpt-5-mini"
 DEFAULT_STATE_FILE = "news_state.json"
+DEFAULT_SUMMARY_CACHE_FILE = "news_summary_cache.json"
+# Feeds refresh through the day; a cached summary older than this is regenerated.
+SUMMARY_CACHE_TTL_HOURS = 6.0
 
 DEFAULT_CISO_FEED_URL = "https://rss.libsyn.com/shows/289580/destinations/2260670.xml"
 DEFAULT_RCD_FEED_URL = "https://www.realcleardefense.com/index.xml"
 
 SLACK_MAX_CHARS = 35000
+SLACK_POST_INTERVAL_S = 1.0  # webhooks allow ~1 message/sec
+SLACK_429_RETRIES = 3
+SLACK_MAX_RETRY_AFTER_S = 60.0  # cap on a single Retry-After wait
+
+# Browser-ish UA to avoid feed blocks; sent on every request from the shared session.
+BROWSER_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+FEED_ACCEPT = "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8"
+MAX_SEEN_IDS = 500  # per feed; oldest IDs are evicted first
+
+# orjson is optional; used for state.json when installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Honor your timezone for "same day" logic
 try:
@@ -69,32 +105,24 @@ def utc_now_iso_z() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
 
-def local_today_date() -> datetime.date:
+def local_today_date() -> date:
     if LOCAL_TZ is None:
         return datetime.now(timezone.utc).date()
     return datetime.now(LOCAL_TZ).date()
 
 
-def parse_datetime_any(raw: str) -> Optional[datetime]:
-    """
-    Parse common RSS/Atom date formats into tz-aware datetime (UTC).
-    Supports RFC2822 and many ISO8601 variants.
-    """
-    if not raw:
-        return None
-
-    # RFC 2822 / RFC 5322
+def parse_rfc2822_datetime(s: str) -> Optional[datetime]:
     try:
-        dt = parsedate_to_datetime(raw)
+        dt = parsedate_to_datetime(s)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt.astimezone(timezone.utc)
     except Exception:
-        pass
+        return None
 
-    # ISO 8601
+
+def parse_iso_datetime(s: str) -> Optional[datetime]:
     try:
-        s = raw.strip()
         if s.endswith("Z"):
             s = s[:-1] + "+00:00"
         dt = datetime.fromisoformat(s)
@@ -105,12 +133,29 @@ def parse_datetime_any(raw: str) -> Optional[datetime]:
         return None
 
 
-def entry_local_date(entry_obj: Any) -> Optional[datetime.date]:
+def parse_datetime_any(raw: str) -> Optional[datetime]:
+    """
+    Parse common RSS/Atom date formats into tz-aware datetime (UTC).
+    Supports RFC2822 and many ISO8601 variants.
+    """
+    if not raw:
+        return None
+    s = raw.strip()
+
+    # Sniff "YYYY-MM-DD..." so ISO 8601 (most Atom feeds) skips the failing RFC 2822 attempt.
+    if s[4:5] == "-" and s[7:8] == "-":
+        return parse_iso_datetime(s) or parse_rfc2822_datetime(s)
+    return parse_rfc2822_datetime(s) or parse_iso_datetime(s)
+
+
+def entry_local_date(entry_obj: Any, tz: Optional[tzinfo] = None) -> Optional[date]:
     """
     Determine entry publish date in local TZ (America/New_York).
     Uses feedparser parsed structs when possible; else parses strings.
+    Pass tz when converting many entries to skip the per-call lookup.
     """
-    tz = LOCAL_TZ or timezone.utc
+    if tz is None:
+        tz = LOCAL_TZ or timezone.utc
 
     st = entry_obj.get("published_parsed") or entry_obj.get("updated_parsed")
     if st:
@@ -131,16 +176,26 @@ def entry_local_date(entry_obj: Any) -> Optional[datetime.date]:
 def load_state(path: str) -> Dict[str, Any]:
     if os.path.exists(path):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(path, "rb") as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
         except Exception:
             return {}
     return {}
 
 
 def save_state(path: str, state: Dict[str, Any]) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2, ensure_ascii=False)
+    """Write state atomically: a crash mid-write must not truncate seen IDs and repost everything."""
+    if orjson is not None:
+        data = orjson.dumps(state)
+    else:
+        data = json.dumps(state, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 
 def ensure_state_shape(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -161,6 +216,69 @@ def ensure_state_shape(state: Dict[str, Any]) -> Dict[str, Any]:
     return state
 
 
+def remember_seen(seen_ids: OrderedDict[str, None], eid: str) -> None:
+    """Mark eid as most recently seen, evicting the oldest IDs past MAX_SEEN_IDS."""
+    seen_ids[eid] = None
+    seen_ids.move_to_end(eid)
+    while len(seen_ids) > MAX_SEEN_IDS:
+        seen_ids.popitem(last=False)
+
+
+# ----------------------------
+# Summary cache
+# ----------------------------
+def summary_cache_key(model: str, instructions: str, user_input: str) -> str:
+    raw = f"{model}\x00{instructions}\x00{user_input}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def load_summary_cache(path: str, ttl_hours: float = SUMMARY_CACHE_TTL_HOURS) -> Dict[str, Any]:
+    """Load cached OpenAI outputs, dropping entries older than ttl_hours."""
+    cache = load_state(path)
+    if not isinstance(cache.get("entries"), dict):
+        return {"entries": {}}
+
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=ttl_hours)
+    fresh: Dict[str, Any] = {}
+    for key, item in cache["entries"].items():
+        try:
+            created = datetime.fromisoformat(item["created_utc"].replace("Z", "+00:00"))
+        except Exception:
+            continue
+        if created >= cutoff:
+            fresh[key] = item
+    cache["entries"] = fresh
+    return cache
+
+
+# ----------------------------
+# HTTP session
+# ----------------------------
+def build_session() -> requests.Session:
+    """Shared HTTP session for feed fetches and Slack posts.
+
+    Reusing one pooled session keeps TLS connections alive across the
+    two feeds and every Slack chunk.
+    """
+    session = requests.Session()
+    session.headers.update(BROWSER_HEADERS)
+
+    # Retry feed GETs on 429/5xx. Slack POSTs are left out: a retried POST
+    # after a 5xx may duplicate a chunk, so post_to_slack handles 429 itself.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return session
+
+
+_SESSION = build_session()
+
+
 # ----------------------------
 # Slack helpers
 # ----------------------------
@@ -169,52 +287,89 @@ def chunk_for_slack(msg: str, max_chars: int = SLACK_MAX_CHARS) -> List[str]:
         return [msg]
     lines = msg.splitlines(True)
     chunks: List[str] = []
-    buf = ""
+    cur: List[str] = []
+    cur_len = 0
     for line in lines:
-        if len(buf) + len(line) > max_chars and buf:
-            chunks.append(buf)
-            buf = ""
-        buf += line
-    if buf:
-        chunks.append(buf)
+        if cur_len + len(line) > max_chars and cur:
+            chunks.append("".join(cur))
+            cur = []
+            cur_len = 0
+        cur.append(line)
+        cur_len += len(line)
+    if cur:
+        chunks.append("".join(cur))
     return chunks
 
 
 def post_to_slack(webhook_url: str, message: str) -> None:
-    r = requests.post(webhook_url, json={"text": message}, timeout=20)
+    # A 429 means Slack rejected the message, so resending it cannot duplicate.
+    for attempt in range(SLACK_429_RETRIES + 1):
+        r = _SESSION.post(webhook_url, json={"text": message}, timeout=20)
+        if r.status_code != 429 or attempt == SLACK_429_RETRIES:
+            break
+        try:
+            wait = float(r.headers.get("Retry-After", 1))
+        except ValueError:
+            wait = 1.0
+        time.sleep(min(max(wait, 0.0), SLACK_MAX_RETRY_AFTER_S))
     if r.status_code >= 300:
         raise RuntimeError(f"Slack webhook error {r.status_code}: {r.text[:400]}")
 
 
 # ----------------------------
-# RSS fetch helpers (requests + UA)
+# RSS fetch helpers
 # ----------------------------
-def fetch_feed_entries(feed_url: str) -> List[Dict[str, Any]]:
+@functools.lru_cache(maxsize=1)
+def load_feedparser() -> Tuple[Any, bool]:
+    """
+    Import the feed parser on first use. Returns (module, is_feedparser_rs).
+    Prefers the Rust feedparser-rs (same parse()/entries API, much faster); falls back to feedparser.
     """
-    Fetch RSS/Atom via requests + browser-ish UA to avoid blocks, parse with feedparser.
-    Returns normalized entries: id, title, link, published, text, local_date (YYYY-MM-DD).
+    try:
+        import feedparser_rs
+        return feedparser_rs, True
+    except ImportError:
+        import feedparser
+        return feedparser, False
+
+
+def fetch_feed_entries(
+    feed_url: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str]]:
+    """
+    Fetch RSS/Atom over the shared session (browser-ish UA to avoid blocks), parse with feedparser.
+    Sends a conditional GET when validators are given; on HTTP 304 returns no entries.
+    Returns (entries, etag, last_modified). Entries are normalized:
+    id, title, link, published, text, local_date (YYYY-MM-DD).
     """
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
-    resp = requests.get(feed_url, headers=headers, timeout=25)
+    headers = {"Accept": FEED_ACCEPT}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    resp = _SESSION.get(feed_url, headers=headers, timeout=25)
+    if resp.status_code == 304:
+        return [], etag, last_modified
     resp.raise_for_status()
 
+    feedparser, is_feedparser_rs = load_feedparser()
     feed = feedparser.parse(resp.content)
 
     if getattr(feed, "bozo", False) and not feed.entries:
         raise RuntimeError(f"RSS parse error: {getattr(feed, 'bozo_exception', 'unknown')}")
 
+    local_tz = LOCAL_TZ or timezone.utc
     out: List[Dict[str, Any]] = []
     for e in feed.entries:
         entry_id = (e.get("id") or e.get("guid") or e.get("link") or e.get("title") or "").strip()
         title = (e.get("title") or "").strip()
+        if is_feedparser_rs:
+            # feedparser-rs returns titles HTML-escaped; feedparser returns plain text.
+            # Close but not exact: a title escaped twice in the feed (e.g. Atom
+            # type="html") loses one more level than feedparser would strip.
+            title = unescape(title)
         link = (e.get("link") or "").strip()
         published = (e.get("published") or e.get("updated") or "").strip()
 
@@ -222,9 +377,11 @@ def fetch_feed_entries(feed_url: str) -> List[Dict[str, Any]]:
         if not text:
             content = e.get("content")
             if isinstance(content, list) and content:
-                text = (content[0].get("value") or "").strip()
+                first = content[0]
+                value = first.get("value") if isinstance(first, dict) else getattr(first, "value", "")
+                text = (value or "").strip()
 
-        ld = entry_local_date(e)
+        ld = entry_local_date(e, local_tz)
         out.append(
             {
                 "id": entry_id,
@@ -235,7 +392,25 @@ def fetch_feed_entries(feed_url: str) -> List[Dict[str, Any]]:
                 "local_date": ld.isoformat() if ld else "",
             }
         )
-    return out
+    return out, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+
+
+def feed_validators(feed_state: Dict[str, Any], feed_url: str) -> Tuple[Optional[str], Optional[str]]:
+    """Stored ETag/Last-Modified for a feed, only if they were recorded for this same URL."""
+    if feed_state.get("feed_url") != feed_url:
+        return None, None
+    return feed_state.get("etag"), feed_state.get("last_modified")
+
+
+def store_validators(
+    feed_state: Dict[str, Any],
+    feed_url: str,
+    etag: Optional[str],
+    last_modified: Optional[str],
+) -> None:
+    feed_state["feed_url"] = feed_url
+    feed_state["etag"] = etag
+    feed_state["last_modified"] = last_modified
 
 
 def normalize_id(entry: Dict[str, Any]) -> str:
@@ -245,51 +420,77 @@ def normalize_id(entry: Dict[str, Any]) -> str:
 # ----------------------------
 # RealClearDefense interest filtering
 # ----------------------------
-RCD_TOPIC_GROUPS: List[Tuple[str, re.Pattern]] = [
-    ("USMC", re.compile(r"\b(usmc|marine corps|marines)\b", re.IGNORECASE)),
-    ("CYBER", re.compile(r"\b(cyber|cyberspace|malware|ransomware|zero[- ]trust|dodin|cybercom|apt)\b", re.IGNORECASE)),
-    ("SPACE", re.compile(r"\b(space|satellite|orbit|spacecom|space force|satcom|pnt)\b", re.IGNORECASE)),
-    ("TECH", re.compile(r"\b(ai|artificial intelligence|machine learning|quantum|autonomous|unmanned|drone|uas|hypersonic|c4isr|electronic warfare|darpa|innovation)\b", re.IGNORECASE)),
-    ("SEC", re.compile(r"\b(security|defense|threat|attack|espionage|intelligence)\b", re.IGNORECASE)),
+# Keyword alternations per topic (lowercase; matched as whole words against lowercased text).
+RCD_TOPIC_GROUPS: List[Tuple[str, str]] = [
+    ("USMC", r"usmc|marine corps|marines"),
+    ("CYBER", r"cyber|cyberspace|malware|ransomware|zero[- ]trust|dodin|cybercom|apt"),
+    ("SPACE", r"space|satellite|orbit|spacecom|space force|satcom|pnt"),
+    ("TECH", r"ai|artificial intelligence|machine learning|quantum|autonomous|unmanned|drone|uas|hypersonic|c4isr|electronic warfare|darpa|innovation"),
+    ("SEC", r"security|defense|threat|attack|espionage|intelligence"),
 ]
-RCD_INTEREST_RE = re.compile("|".join(p.pattern for _, p in RCD_TOPIC_GROUPS), re.IGNORECASE)
-
+# One alternation with a named group per topic, so a single scan yields every matching topic.
+# It sits in a zero-width lookahead so every word start is tested: keywords from different
+# groups may overlap ("artificial intelligence" is TECH, "intelligence" is SEC) and a
+# consuming match would hide the later one.
+RCD_TOPIC_RE = re.compile(r"(?=\b(?:" + "|".join(f"(?P<{name}>{alts})" for name, alts in RCD_TOPIC_GROUPS) + r")\b)")
+RCD_TOPIC_ORDER = {name: i for i, (name, _) in enumerate(RCD_TOPIC_GROUPS)}
 
-def rcd_is_interesting(title: str, text: str) -> bool:
-    return bool(RCD_INTEREST_RE.search(f"{title}\n{text}"))
 
-
-def rcd_tags(title: str, text: str) -> List[str]:
-    blob = f"{title}\n{text}"
-    tags = [name for name, pat in RCD_TOPIC_GROUPS if pat.search(blob)]
-    return tags[:3]
+def rcd_classify(title: str, text: str) -> Optional[List[str]]:
+    """
+    Return up to 3 topic tags (in RCD_TOPIC_GROUPS order) for an entry,
+    or None if it matches no interest keyword.
+    """
+    found = {m.lastgroup for m in RCD_TOPIC_RE.finditer(f"{title}\n{text}".lower())}
+    if not found:
+        return None
+    return sorted(found, key=RCD_TOPIC_ORDER.__getitem__)[:3]
 
 
-def rcd_is_in_window(local_date_iso: str, days_back: int = 1) -> bool:
+def rcd_is_in_window(local_date_iso: str, today_ord: int, days_back: int = 1) -> bool:
     """
     Allow items from today OR the previous `days_back` day(s) (local time).
-    days_back=1 => today + yesterday.
+    days_back=1 => today + yesterday. today_ord is local_today_date().toordinal(),
+    computed once per run by the caller.
     """
     if not local_date_iso:
         return False
     try:
-        d = datetime.fromisoformat(local_date_iso).date()
+        d_ord = date.fromisoformat(local_date_iso).toordinal()
     except Exception:
         return False
-    today = local_today_date()
-    delta_days = (today - d).days
-    return 0 <= delta_days <= max(0, days_back)
+    return 0 <= today_ord - d_ord <= max(0, days_back)
 
 
 # ----------------------------
 # OpenAI summarizers
 # ----------------------------
+def create_summary(
+    client: OpenAI,
+    model: str,
+    instructions: str,
+    user_input: str,
+    cache: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Call the Responses API, reusing a cached output for byte-identical requests."""
+    key = summary_cache_key(model, instructions, user_input)
+    if cache is not None and key in cache:
+        return cache[key]["output"]
+
+    resp = client.responses.create(model=model, instructions=instructions, input=user_input)
+    out = (resp.output_text or "").strip()
+    if out and cache is not None:
+        cache[key] = {"output": out, "created_utc": utc_now_iso_z()}
+    return out
+
+
 def summarize_ciso_rollup_to_bullets(
     client: OpenAI,
     model: str,
     episode: Dict[str, Any],
     max_bullets: int,
     sentences: int,
+    cache: Optional[Dict[str, Any]] = None,
 ) -> str:
     max_bullets = max(1, max_bullets)
     sentences = max(1, sentences)
@@ -314,8 +515,7 @@ def summarize_ciso_rollup_to_bullets(
         f"{episode['text']}"
     )
 
-    resp = client.responses.create(model=model, instructions=instructions, input=user_input)
-    out = (resp.output_text or "").strip()
+    out = create_summary(client, model, instructions, user_input, cache=cache)
     if not out:
         out = f"- <{episode['link']}|{episode['title']}> - (No roll-up text found.)"
     return out
@@ -326,6 +526,7 @@ def summarize_rcd_selected_entries(
     model: str,
     selected: List[Dict[str, Any]],
     bullets_per_article: int,
+    cache: Optional[Dict[str, Any]] = None,
 ) -> str:
     bullets_per_article = max(5, min(bullets_per_article, 6))
     instructions = (
@@ -350,8 +551,7 @@ def summarize_rcd_selected_entries(
 
     user_input = "ARTICLES:\n\n" + "\n---\n".join(parts)
 
-    resp = client.responses.create(model=model, instructions=instructions, input=user_input)
-    out = (resp.output_text or "").strip()
+    out = create_summary(client, model, instructions, user_input, cache=cache)
     if not out:
         out = "- (No RealClearDefense summary produced.)"
     return out
@@ -363,6 +563,11 @@ def summarize_rcd_selected_entries(
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="News summarizer: CISO rollup + filtered RealClearDefense")
     p.add_argument("--state-file", default=DEFAULT_STATE_FILE)
+    p.add_argument(
+        "--summary-cache",
+        default=None,
+        help=f"Path to summary cache JSON (default: {DEFAULT_SUMMARY_CACHE_FILE} next to the state file)",
+    )
     p.add_argument("--model", default=os.getenv("OPENAI_MODEL", DEFAULT_MODEL))
 
     p.add_argument("--dry-run", action="store_true", help="Print output; do not post to Slack")
@@ -402,21 +607,38 @@ def main() -> int:
     state["last_run_utc"] = utc_now_iso_z()
     state["last_run_mode"] = "dry-run" if args.dry_run else "post"
 
-    ciso_seen = set(state["feeds"]["ciso"].get("seen_ids", []))
-    rcd_seen = set(state["feeds"]["rcd"].get("seen_ids", []))
+    # Insertion-ordered so the oldest IDs are evicted first; saved as-is (no sort).
+    ciso_seen: OrderedDict[str, None] = OrderedDict.fromkeys(state["feeds"]["ciso"].get("seen_ids", []))
+    rcd_seen: OrderedDict[str, None] = OrderedDict.fromkeys(state["feeds"]["rcd"].get("seen_ids", []))
+
+    # Conditional GET: an unchanged feed (HTTP 304) yields no entries. --force and --dry-run
+    # always fetch the full feed so they still show output.
+    use_validators = not (args.force or args.dry_run)
+    ciso_etag, ciso_modified = feed_validators(state["feeds"]["ciso"], ciso_url) if use_validators else (None, None)
+    rcd_etag, rcd_modified = feed_validators(state["feeds"]["rcd"], rcd_url) if use_validators else (None, None)
+
+    # Both feeds are network-bound; fetch them concurrently so wall time is the slower of the two.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        ciso_future = pool.submit(fetch_feed_entries, ciso_url, ciso_etag, ciso_modified)
+        rcd_future = pool.submit(fetch_feed_entries, rcd_url, rcd_etag, rcd_modified)
+
+    cache_path = args.summary_cache or os.path.join(os.path.dirname(args.state_file), DEFAULT_SUMMARY_CACHE_FILE)
+    summary_cache = load_summary_cache(cache_path)
 
-    client = OpenAI(api_key=openai_key)
     sections: List[str] = []
 
     # ----------------------------
     # CISO (first entry only)
     # ----------------------------
     try:
-        ciso_entries = fetch_feed_entries(ciso_url)
+        ciso_entries, ciso_etag, ciso_modified = ciso_future.result()
+        if not args.dry_run:
+            store_validators(state["feeds"]["ciso"], ciso_url, ciso_etag, ciso_modified)
     except Exception as ex:
         print(f"[ERROR] CISO feed failed: {ex}", file=sys.stderr)
         ciso_entries = []
 
+    ciso_ep: Optional[Dict[str, Any]] = None
     if ciso_entries:
         ep = ciso_entries[0]
         ep_id = normalize_id(ep)
@@ -431,45 +653,40 @@ def main() -> int:
             print(f"[DEBUG] CISO seen={ep_id in ciso_seen} should_post={should_post}", file=sys.stderr)
 
         if should_post or args.dry_run:
-            bullets = summarize_ciso_rollup_to_bullets(
-                client=client,
-                model=args.model,
-                episode={"title": ep["title"], "link": ep["link"], "published": ep["published"], "text": ep["text"]},
-                max_bullets=args.ciso_max_bullets,
-                sentences=args.ciso_sentences,
-            )
-
-            sections.append(
-                f"*Cyber Security Headlines* - {ep['published']}\n<{ep['link']}|Episode link>\n\n{bullets}"
-            )
-
-            if not args.dry_run and ep_id:
-                ciso_seen.add(ep_id)
-                state["feeds"]["ciso"]["seen_ids"] = sorted(ciso_seen)
-                state["feeds"]["ciso"]["last_posted_utc"] = utc_now_iso_z()
+            ciso_ep = ep
 
     # ----------------------------
     # RealClearDefense (window + interest + seen gate)
     # ----------------------------
     try:
-        rcd_entries = fetch_feed_entries(rcd_url)
+        rcd_entries, rcd_etag, rcd_modified = rcd_future.result()
     except Exception as ex:
         print(f"[ERROR] RCD feed failed: {ex}", file=sys.stderr)
         rcd_entries = []
+        rcd_etag = rcd_modified = None
 
     today = local_today_date()
     if args.debug:
         print(f"[DEBUG] Local today={today.isoformat()} window_days={args.rcd_window_days}", file=sys.stderr)
 
+    today_ord = today.toordinal()
     pipeline = {"total": len(rcd_entries), "in_window": 0, "new_in_window": 0, "interest_new_in_window": 0, "selected": 0}
 
+    # Feeds are normally newest-first. When they are, the first entry older than the window
+    # means the rest are too, so stop scanning instead of testing every remaining entry.
+    dated = [e["local_date"] for e in rcd_entries if e.get("local_date")]
+    newest_first = all(a >= b for a, b in zip(dated, dated[1:]))
+    window_start = date.fromordinal(today_ord - max(0, args.rcd_window_days)).isoformat()
+
     candidates: List[Dict[str, Any]] = []
     for e in rcd_entries:
         eid = normalize_id(e)
         if not eid:
             continue
 
-        if not rcd_is_in_window(e.get("local_date", ""), days_back=args.rcd_window_days):
+        if not rcd_is_in_window(e.get("local_date", ""), today_ord, days_back=args.rcd_window_days):
+            if newest_first and e.get("local_date") and e["local_date"] < window_start:
+                break
             continue
         pipeline["in_window"] += 1
 
@@ -477,18 +694,27 @@ def main() -> int:
             continue
         pipeline["new_in_window"] += 1
 
-        if not rcd_is_interesting(e["title"], e["text"]):
+        tags = rcd_classify(e["title"], e["text"])
+        if tags is None:
             continue
         pipeline["interest_new_in_window"] += 1
 
         e2 = dict(e)
         e2["id"] = eid
-        e2["tags"] = rcd_tags(e["title"], e["text"])
+        e2["tags"] = tags
         candidates.append(e2)
 
     candidates = candidates[: max(1, args.rcd_max_items)]
     pipeline["selected"] = len(candidates)
 
+    # Keep the validators only when every interesting entry was selected; otherwise a 304
+    # next run would hide the overflow that did not fit under --rcd-max-items.
+    if not args.dry_run:
+        overflow = pipeline["interest_new_in_window"] > pipeline["selected"]
+        if overflow:
+            rcd_etag = rcd_modified = None
+        store_validators(state["feeds"]["rcd"], rcd_url, rcd_etag, rcd_modified)
+
     state["feeds"]["rcd"]["last_scan_today_local"] = today.isoformat()
     state["feeds"]["rcd"]["last_pipeline_counts"] = pipeline
     state["feeds"]["rcd"]["last_scan_count"] = len(rcd_entries)
@@ -496,14 +722,50 @@ def main() -> int:
     if args.debug:
         print(f"[DEBUG] RCD pipeline: {pipeline}", file=sys.stderr)
 
-    if candidates:
-        rcd_bullets = summarize_rcd_selected_entries(
-            client=client,
-            model=args.model,
-            selected=candidates,
-            bullets_per_article=args.rcd_bullets_per_article,
+    # ----------------------------
+    # Summarize (CISO and RCD prompts are independent; run them concurrently)
+    # ----------------------------
+    ciso_summary = rcd_summary = None
+    if ciso_ep is not None or candidates:
+        from openai import OpenAI
+
+        client = OpenAI(api_key=openai_key)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            if ciso_ep is not None:
+                ciso_summary = pool.submit(
+                    summarize_ciso_rollup_to_bullets,
+                    client=client,
+                    model=args.model,
+                    episode={"title": ciso_ep["title"], "link": ciso_ep["link"], "published": ciso_ep["published"], "text": ciso_ep["text"]},
+                    max_bullets=args.ciso_max_bullets,
+                    sentences=args.ciso_sentences,
+                    cache=summary_cache["entries"],
+                )
+            if candidates:
+                rcd_summary = pool.submit(
+                    summarize_rcd_selected_entries,
+                    client=client,
+                    model=args.model,
+                    selected=candidates,
+                    bullets_per_article=args.rcd_bullets_per_article,
+                    cache=summary_cache["entries"],
+                )
+
+    if ciso_summary is not None:
+        bullets = ciso_summary.result()
+        sections.append(
+            f"*Cyber Security Headlines* - {ciso_ep['published']}\n<{ciso_ep['link']}|Episode link>\n\n{bullets}"
         )
 
+        ep_id = normalize_id(ciso_ep)
+        if not args.dry_run and ep_id:
+            remember_seen(ciso_seen, ep_id)
+            state["feeds"]["ciso"]["seen_ids"] = list(ciso_seen)
+            state["feeds"]["ciso"]["last_posted_utc"] = utc_now_iso_z()
+
+    if rcd_summary is not None:
+        rcd_bullets = rcd_summary.result()
+
         tag_line = " / ".join(sorted({t for c in candidates for t in c.get("tags", [])})) or "Filtered"
         sections.append(
             f"*RealClearDefense (window: today+{args.rcd_window_days}d, filtered: {tag_line})* - {today.isoformat()}\n\n{rcd_bullets}"
@@ -511,8 +773,8 @@ def main() -> int:
 
         if not args.dry_run:
             for e in candidates:
-                rcd_seen.add(e["id"])
-            state["feeds"]["rcd"]["seen_ids"] = sorted(rcd_seen)
+                remember_seen(rcd_seen, e["id"])
+            state["feeds"]["rcd"]["seen_ids"] = list(rcd_seen)
             state["feeds"]["rcd"]["last_posted_utc"] = utc_now_iso_z()
 
     # ----------------------------
@@ -520,13 +782,18 @@ def main() -> int:
     # ----------------------------
     if sections:
         combined = ("\n\n" + ("-" * 30) + "\n\n").join(sections)
-        for chunk in chunk_for_slack(combined):
+        # Chunks are posted in order over the shared session; Slack does not guarantee
+        # ordering for concurrent webhook posts, so pace them instead of parallelizing.
+        for i, chunk in enumerate(chunk_for_slack(combined)):
             if args.dry_run:
                 print(chunk)
-            else:
-                post_to_slack(slack_webhook, chunk)
+                continue
+            if i:
+                time.sleep(SLACK_POST_INTERVAL_S)
+            post_to_slack(slack_webhook, chunk)
 
     save_state(args.state_file, state)
+    save_state(cache_path, summary_cache)
     return 0
 
 
@@ -16,13 +16,23 @@ import argparse
 import datetime as dt
 import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from openai import OpenAI
 
+# orjson is optional; it parses state faster than stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 LIBSYN_BASE = "https://traffic.libsyn.com/secure/cisoseries"
 
@@ -34,6 +44,41 @@ FILENAME_PATTERNS = [
 DEFAULT_STATE_PATH = Path("ciso_state.json")
 DEFAULT_OUT_DIR = Path("ciso_downloads")
 DEFAULT_MODEL = "gpt-4o-mini"
+MAX_PROBE_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Transcripts longer than this are summarized map-reduce style in chunks of
+# TRANSCRIPT_CHUNK_CHARS; shorter ones (a normal Headlines episode) go in one call.
+SINGLE_PASS_MAX_CHARS = 24000
+TRANSCRIPT_CHUNK_CHARS = 8000
+MAX_SUMMARY_WORKERS = 4
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+SYSTEM_PROMPT = "You summarize cybersecurity podcast transcripts accurately and concisely."
+SUMMARY_FORMAT = (
+    "Summarize this episode as:\n"
+    "1) 8-12 bullets (each starts with a bold headline)\n"
+    "2) 3 key takeaways\n"
+    "3) Any action items for a security team\n\n"
+)
+
+
+def build_session() -> requests.Session:
+    """One session so probes and the download share pooled TLS connections to Libsyn."""
+    session = requests.Session()
+    # Retry transient CDN errors; raise_on_status=False hands the final response back.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=MAX_PROBE_WORKERS, max_retries=retry))
+    return session
+
+
+_SESSION = build_session()
 
 
 def build_candidate_urls(day: dt.date) -> list[str]:
@@ -50,45 +95,71 @@ def build_candidate_urls(day: dt.date) -> list[str]:
 
 
 def url_exists(url: str, timeout: int = 20) -> bool:
+    # A 1-byte ranged GET works on hosts that reject HEAD and never pulls the MP3 body;
+    # servers that ignore Range answer 200, and stream=True keeps that body unread.
     try:
-        r = requests.head(url, allow_redirects=True, timeout=timeout)
-        # Some hosts may not support HEAD reliably; treat 405 as "try GET".
-        if r.status_code == 405:
-            r = requests.get(url, stream=True, timeout=timeout)
-            return r.status_code == 200
-        return r.status_code == 200
+        with _SESSION.get(url, headers={"Range": "bytes=0-0"}, stream=True, allow_redirects=True, timeout=timeout) as r:
+            return r.status_code in (200, 206)
     except requests.RequestException:
         return False
 
 
-def choose_available_audio_url(day: dt.date) -> str | None:
-    for url in build_candidate_urls(day):
-        if url_exists(url):
-            return url
-    return None
+def find_available_audio_urls(days: list[dt.date]) -> dict[dt.date, str]:
+    """
+    Probe every candidate URL for every day at once and return the first
+    available URL per day (in FILENAME_PATTERNS order).
+    """
+    candidates = [(day, url) for day in days for url in build_candidate_urls(day)]
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_PROBE_WORKERS, len(candidates)))) as pool:
+        live = list(pool.map(url_exists, [url for _, url in candidates]))
+
+    found: dict[dt.date, str] = {}
+    for (day, url), ok in zip(candidates, live):
+        if ok and day not in found:
+            found[day] = url
+    return found
 
 
 def load_state(path: Path) -> dict:
     if path.exists():
         try:
-            return json.loads(path.read_text(encoding="utf-8"))
+            raw = path.read_bytes()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
         except Exception:
             return {"processed": {}}
     return {"processed": {}}
 
 
 def save_state(path: Path, state: dict) -> None:
-    path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
-
-
-def download_audio(url: str, out_path: Path) -> None:
+    # Atomic write: a truncated state file would mean re-transcribing episodes we already paid for.
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, separators=(",", ":"), sort_keys=True, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def download_audio(url: str, out_path: Path) -> bool:
+    """
+    Stream the episode to disk. Returns False (without reading the body) if
+    out_path already exists with the server's Content-Length.
+    """
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with requests.get(url, stream=True, timeout=60) as r:
+    with _SESSION.get(url, stream=True, timeout=60) as r:
         r.raise_for_status()
-        with open(out_path, "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024 * 1024):
+        length = r.headers.get("Content-Length")
+        if length and length.isdigit() and out_path.exists() and out_path.stat().st_size == int(length):
+            return False
+
+        # Write to a side file so an interrupted download never looks complete.
+        part_path = out_path.with_name(out_path.name + ".part")
+        with open(part_path, "wb") as f:
+            for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 if chunk:
                     f.write(chunk)
+        os.replace(part_path, out_path)
+    return True
 
 
 def transcribe_audio(client: OpenAI, audio_path: Path) -> str:
@@ -102,24 +173,82 @@ def transcribe_audio(client: OpenAI, audio_path: Path) -> str:
     return text
 
 
-def summarize_transcript(client: OpenAI, model: str, transcript: str) -> str:
-    # Responses API is recommended for new projects. :contentReference[oaicite:3]{index=3}
+def split_transcript(transcript: str, max_chars: int = TRANSCRIPT_CHUNK_CHARS) -> list[str]:
+    """
+    Split on paragraph boundaries into chunks of at most max_chars, falling back
+    to sentence boundaries (and finally a hard cut) for oversized paragraphs.
+    """
+    pieces: list[str] = []
+    for para in transcript.split("\n\n"):
+        para = para.strip()
+        if not para:
+            continue
+        if len(para) <= max_chars:
+            pieces.append(para)
+            continue
+        for sentence in SENTENCE_END_RE.split(para):
+            while len(sentence) > max_chars:
+                pieces.append(sentence[:max_chars])
+                sentence = sentence[max_chars:]
+            if sentence:
+                pieces.append(sentence)
+
+    chunks: list[str] = []
+    cur: list[str] = []
+    cur_len = 0
+    for piece in pieces:
+        if cur and cur_len + len(piece) + 1 > max_chars:
+            chunks.append("\n".join(cur))
+            cur = []
+            cur_len = 0
+        cur.append(piece)
+        cur_len += len(piece) + 1
+    if cur:
+        chunks.append("\n".join(cur))
+    return chunks
+
+
+def summarize_chunk(client: OpenAI, model: str, chunk: str, index: int, total: int) -> str:
     resp = client.responses.create(
         model=model,
         input=[
-            {"role": "system", "content": "You summarize cybersecurity podcast transcripts accurately and concisely."},
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": (
-                "Summarize this episode as:\n"
-                "1) 8-12 bullets (each starts with a bold headline)\n"
-                "2) 3 key takeaways\n"
-                "3) Any action items for a security team\n\n"
-                f"TRANSCRIPT:\n{transcript}"
+                f"This is part {index} of {total} of a podcast transcript.\n"
+                "List every distinct story or point it covers as terse notes, keeping names, "
+                "vendors, CVEs, numbers, and dates. Do not add anything not in the text.\n\n"
+                f"TRANSCRIPT PART:\n{chunk}"
             )},
         ],
     )
     return resp.output_text
 
 
+def summarize_transcript(client: OpenAI, model: str, transcript: str) -> str:
+    # Responses API is recommended for new projects. :contentReference[oaicite:3]{index=3}
+    if len(transcript) <= SINGLE_PASS_MAX_CHARS:
+        source = f"TRANSCRIPT:\n{transcript}"
+    else:
+        # Map: condense chunks in parallel; reduce: one final call in the usual format.
+        chunks = split_transcript(transcript)
+        with ThreadPoolExecutor(max_workers=min(MAX_SUMMARY_WORKERS, len(chunks))) as pool:
+            futures = [
+                pool.submit(summarize_chunk, client, model, chunk, i, len(chunks))
+                for i, chunk in enumerate(chunks, start=1)
+            ]
+            notes = [f.result() for f in futures]
+        source = "NOTES FROM CONSECUTIVE TRANSCRIPT PARTS:\n\n" + "\n\n---\n\n".join(notes)
+
+    resp = client.responses.create(
+        model=model,
+        input=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": SUMMARY_FORMAT + source},
+        ],
+    )
+    return resp.output_text
+
+
 def main():
     load_dotenv()
     ap = argparse.ArgumentParser()
@@ -136,11 +265,13 @@ def main():
     # Use local date; if you run via cron in the morning, this matches your timezone.
     today = dt.date.today()
 
+    days = [today - dt.timedelta(days=delta) for delta in range(0, args.days_back + 1)]
+    available = find_available_audio_urls(days)
+
     chosen_day = None
     chosen_url = None
-    for delta in range(0, args.days_back + 1):
-        day = today - dt.timedelta(days=delta)
-        url = choose_available_audio_url(day)
+    for day in days:
+        url = available.get(day)
         if url:
             # Skip if already processed
             if processed.get(url):
@@ -172,7 +303,8 @@ def main():
     summary_path = args.outdir / f"CSH_{chosen_day.strftime('%Y%m%d')}.summary.md"
 
     print(f"Downloading -> {audio_path}")
-    download_audio(chosen_url, audio_path)
+    if not download_audio(chosen_url, audio_path):
+        print("Already downloaded; skipping.")
 
     print("Transcribing...")
     transcript = transcribe_audio(client, audio_path)